@@ -0,0 +1,743 @@
+"""
+Lambda handler that extracts PC specs from files uploaded to S3 with Bedrock
+and stores them in DynamoDB.
+
+The stack deploys it with 1769 MB of memory, which is one full vCPU. Lambda
+scales network bandwidth with memory as well, and almost all of the time here
+goes to S3 downloads and Bedrock uploads, so a smaller size is rarely cheaper.
+Override it with the lambda_memory CDK context after power tuning.
+"""
+import hashlib
+import json
+import os
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import logging
+import threading
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal, DecimalException
+from io import BytesIO
+from boto3.s3.transfer import TransferConfig
+from boto3.dynamodb.types import DYNAMODB_CONTEXT, TypeSerializer
+
+try:
+    from snapshot_restore_py import register_after_restore, register_before_snapshot
+except ImportError:
+    # Only provided by the Lambda Python runtime (3.12+)
+    register_after_restore = register_before_snapshot = None
+
+# Configure logging; the stack sets LOG_LEVEL=WARNING so successful files
+# do not produce CloudWatch log writes. logging only knows upper-case level
+# names, so "-c log_level=info" is accepted too
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
+# Shared client config: keep TCP connections alive and pooled so warm
+# invocations reuse sockets instead of paying a new TLS handshake per call,
+# and fail a stalled connection attempt fast so it is retried
+client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=2,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+# Upper bound on files from one S3 event that are sent to Bedrock at the same time
+MAX_CONCURRENT_FILES = 10
+
+# Ranged GETs per download of an object above the multipart threshold
+S3_DOWNLOAD_CONCURRENCY = 8
+
+# Initialize AWS clients; every concurrent file may run a full multipart
+# download, so the S3 pool is sized for the worst case
+s3_client = boto3.client(
+    "s3",
+    config=client_config.merge(
+        Config(max_pool_connections=MAX_CONCURRENT_FILES * S3_DOWNLOAD_CONCURRENCY)
+    ),
+)
+bedrock_runtime = boto3.client(
+    "bedrock-runtime",
+    config=client_config.merge(Config(read_timeout=60)),
+)
+dynamodb_client = boto3.client("dynamodb", config=client_config)
+
+# Download objects larger than 1 MB as parallel ranged GETs
+s3_transfer_config = TransferConfig(
+    multipart_threshold=1024 * 1024,
+    max_concurrency=S3_DOWNLOAD_CONCURRENCY,
+    use_threads=True,
+)
+
+# Get environment variables
+DYNAMODB_TABLE_NAME = os.environ["DYNAMODB_TABLE_NAME"]
+BEDROCK_MODEL_ID = os.environ["BEDROCK_MODEL_ID"]
+PC_SPECS_BUCKET_NAME = os.environ["PC_SPECS_BUCKET_NAME"]
+
+# Only needed for attribute types the fast path in to_attribute_value() does not cover
+type_serializer = TypeSerializer()
+
+
+def warm_up_connection(service_name, operation, **kwargs):
+    """
+    Makes a cheap call in the background during INIT to resolve credentials and
+    open a pooled connection, so the first invocation does not pay for it.
+    """
+    try:
+        operation(**kwargs)
+    except Exception as e:
+        logger.warning("%s warm-up failed: %s", service_name, e)
+
+
+def warm_up_connections():
+    """
+    Opens the S3, Bedrock runtime and DynamoDB connections concurrently in
+    daemon threads, without blocking INIT. Returns the started threads.
+    """
+    threads = []
+    for service_name, operation, kwargs in (
+        ("S3", s3_client.head_bucket, {"Bucket": PC_SPECS_BUCKET_NAME}),
+        ("Bedrock", bedrock_runtime.list_async_invokes, {"maxResults": 1}),
+        ("DynamoDB", dynamodb_client.describe_table, {"TableName": DYNAMODB_TABLE_NAME}),
+    ):
+        thread = threading.Thread(
+            target=warm_up_connection,
+            args=(service_name, operation),
+            kwargs=kwargs,
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+warm_up_threads = warm_up_connections()
+
+
+def finish_warm_up():
+    """
+    Lets the INIT warm-up calls complete before SnapStart takes the snapshot,
+    so endpoint resolution and credentials are captured in it.
+    """
+    for thread in warm_up_threads:
+        thread.join(timeout=5)
+
+
+if register_before_snapshot is not None:
+    register_before_snapshot(finish_warm_up)
+    # Sockets captured in the snapshot are dead after a restore, so open fresh ones
+    register_after_restore(warm_up_connections)
+
+# Define supported file types
+SUPPORTED_EXTENSIONS = {
+    ".png": "png",
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+    ".txt": "text",
+    ".pdf": "pdf",
+}
+
+# BatchWriteItem accepts at most 25 put requests per call
+BATCH_WRITE_SIZE = 25
+
+# DynamoDB errors that are retried with backoff once botocore's own retries give up
+RETRYABLE_DYNAMODB_ERRORS = frozenset(
+    {
+        "ProvisionedThroughputExceededException",
+        "ThrottlingException",
+        "InternalServerError",
+    }
+)
+DYNAMODB_WRITE_ATTEMPTS = 5
+
+# SystemRandom, because the random module's state is shared by every SnapStart restore
+jitter = random.SystemRandom()
+
+# Images above this size are downscaled and re-encoded as JPEG before upload
+IMAGE_COMPRESSION_THRESHOLD = 1_000_000
+IMAGE_MAX_DIMENSION = 1568
+IMAGE_JPEG_QUALITY = 85
+
+# Largest upload accepted per format, checked against the size in the S3 event.
+# PDFs must fit Bedrock's 4.5 MB document limit; large images are compressed
+# before upload, so they only need an upper bound. Text is read with a range
+MAX_FILE_SIZES = {
+    "pdf": int(4.5 * 1024 * 1024),
+    "png": 20 * 1024 * 1024,
+    "jpeg": 20 * 1024 * 1024,
+}
+
+# Only the start of a text file is sent to Bedrock; a spec sheet fits well within it
+TEXT_READ_LIMIT = 64 * 1024
+
+# S3 invokes the function asynchronously and discards the result, so success
+# needs no body
+SUCCESS_RESPONSE = {"statusCode": 200}
+
+# Converse document format for each file format sent as a document block
+DOCUMENT_FORMATS = {
+    "pdf": "pdf",
+    "text": "txt",
+}
+
+# Fields returned by the JSON tool, split by type
+STRING_FIELDS = ("name", "cpu")
+NUMERIC_FIELDS = (
+    "ram",
+    "storage",
+    "resolution_width",
+    "resolution_height",
+    "monitor_size",
+    "price",
+)
+DECIMAL_ZERO = Decimal(0)
+
+# Instruction sent with every file
+INSTRUCTION_TEXT = """
+Extract the following PC specifications and format them as JSON:
+- name of pc
+- name of cpu
+- amount of RAM (in GB)
+- amount of storage (in GB)
+- resolution width (in pixels)
+- resolution height (in pixels)
+- size of monitor (in inches)
+- price (in yen)
+
+Return ONLY a valid JSON object with these fields. If a field is not found or cannot be determined,
+use an empty string for string fields and 0 for numeric fields.
+"""
+
+# Static start of every user message; the cache point keeps the file content
+# that follows outside the cached prefix
+INSTRUCTION_CONTENT = (
+    {"text": INSTRUCTION_TEXT},
+    {"cachePoint": {"type": "default"}},
+)
+
+# Define the tools with updated schema to include price and separate resolution
+TOOL_CONFIG = {
+    "tools": [
+        {
+            "toolSpec": {
+                "name": "json_tool",
+                "description": "Generate a JSON object with PC specifications",
+                "inputSchema": {
+                    "json": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the PC",
+                            },
+                            "cpu": {
+                                "type": "string",
+                                "description": "Name of the CPU",
+                            },
+                            "ram": {
+                                "type": "number",
+                                "description": "Amount of RAM in GB",
+                            },
+                            "storage": {
+                                "type": "number",
+                                "description": "Amount of storage in GB",
+                            },
+                            "resolution_width": {
+                                "type": "number",
+                                "description": "Width of monitor resolution in pixels",
+                            },
+                            "resolution_height": {
+                                "type": "number",
+                                "description": "Height of monitor resolution in pixels",
+                            },
+                            "monitor_size": {
+                                "type": "number",
+                                "description": "Size of monitor in inches",
+                            },
+                            "price": {
+                                "type": "number",
+                                "description": "Price in Japanese yen",
+                            },
+                        },
+                        "required": [
+                            "name",
+                            "cpu",
+                            "ram",
+                            "storage",
+                            "resolution_width",
+                            "resolution_height",
+                            "monitor_size",
+                            "price",
+                        ],
+                    },
+                },
+            }
+        },
+        # Cache the invariant tool definition across invocations
+        {"cachePoint": {"type": "default"}},
+    ]
+}
+
+
+def handler(event, context):
+    """
+    Lambda function handler that processes PC specs files from S3,
+    sends them to Bedrock for extraction using Converse API, and stores the results in DynamoDB.
+    Supports PNG, JPEG, PDF, and text files. Every record in the S3 event is processed.
+    """
+    try:
+        # Validate every record's extension and size before touching S3, so
+        # unsupported or oversized uploads never cost a GetObject
+        files_to_process = []
+        rejection = None
+
+        for record in event["Records"]:
+            # Get the S3 bucket, key and size from the record
+            bucket = record["s3"]["bucket"]["name"]
+            key = record["s3"]["object"]["key"]
+            size = record["s3"]["object"].get("size", 0)
+
+            # Determine file format from the extension (only the extension is lowercased)
+            file_extension = os.path.splitext(key)[1].lower()
+            file_format = SUPPORTED_EXTENSIONS.get(file_extension)
+
+            if file_format is None:
+                logger.error("Unsupported file type: %s", file_extension)
+                rejection = {
+                    "statusCode": 400,
+                    "body": json.dumps(f"Unsupported file type: {file_extension}"),
+                }
+                continue
+
+            max_size = MAX_FILE_SIZES.get(file_format)
+            if max_size is not None and size > max_size:
+                logger.error("File %s is too large: %s bytes", key, size)
+                rejection = {
+                    "statusCode": 413,
+                    "body": json.dumps(f"File too large: {size} bytes"),
+                }
+                continue
+
+            # Identifies this upload of the object, so a retried event yields
+            # the same fallback name
+            default_name = fallback_name(
+                bucket, key, record["s3"]["object"].get("sequencer", "")
+            )
+            files_to_process.append((bucket, key, size, file_format, default_name))
+
+        if not files_to_process:
+            return rejection
+
+        # Store each result as soon as it is extracted. Several records are
+        # processed concurrently and go through the batch writer, which sends full
+        # 25-item BatchWriteItem calls as it fills and flushes the rest on exit,
+        # even if a later record fails
+        if len(files_to_process) == 1:
+            bucket, key, size, file_format, default_name = files_to_process[0]
+            pc_specs = process_file(bucket, key, size, file_format)
+            store_in_dynamodb(pc_specs, default_name)
+        else:
+            max_workers = min(MAX_CONCURRENT_FILES, len(files_to_process))
+            with BatchWriter() as batch, ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = {}
+                for bucket, key, size, file_format, default_name in files_to_process:
+                    future = executor.submit(
+                        process_file, bucket, key, size, file_format
+                    )
+                    futures[future] = default_name
+                # The batch writer is not thread-safe, so only this thread uses it.
+                # A failure still fails the invocation so S3 retries the event. The
+                # retry runs every record through Bedrock again, but rewrites the
+                # same items: names are either extracted or derived from the object
+                first_error = None
+                for future in as_completed(futures):
+                    try:
+                        store_in_dynamodb(future.result(), futures[future], batch)
+                    except Exception as e:
+                        if first_error is None:
+                            first_error = e
+                # Raised inside the batch writer so the successes are still flushed
+                if first_error is not None:
+                    raise first_error
+
+        return SUCCESS_RESPONSE
+
+    except Exception as e:
+        logger.error("Error processing file: %s", e)
+        raise e
+
+
+def fallback_name(bucket, key, sequencer):
+    """
+    Returns the name for specs Bedrock could not name, derived from the S3
+    object and the sequencer of its upload.
+    """
+    digest = hashlib.sha256(json.dumps([bucket, key, sequencer]).encode()).hexdigest()
+    return "pc-" + digest[:32]
+
+
+def process_file(bucket, key, size, file_format):
+    """
+    Reads one file of the given size (from the S3 event) from S3 and returns
+    the PC specs Bedrock extracts from it.
+    """
+    logger.info("Processing %s file %s from bucket %s", file_format, key, bucket)
+
+    # Get the file content from S3
+    if file_format == "text":
+        file_content = read_text_from_s3(bucket, key)
+    else:
+        file_content = read_bytes_from_s3(bucket, key, size)
+
+    # Shrink large images before uploading them to Bedrock
+    if file_format in ("png", "jpeg") and len(file_content) > IMAGE_COMPRESSION_THRESHOLD:
+        file_content, file_format = compress_image(file_content, file_format)
+
+    # Call Bedrock Converse API to extract PC specs
+    return call_bedrock_converse(file_content, file_format)
+
+
+def compress_image(file_content, file_format):
+    """
+    Downscales an image to fit IMAGE_MAX_DIMENSION and re-encodes it as JPEG.
+    Bedrock vision models resize to about that size anyway, so this only cuts
+    upload time. Returns the original image if re-encoding does not make it smaller.
+    """
+    # Imported here so text and PDF invocations never load Pillow
+    from PIL import Image, ImageOps
+
+    with Image.open(BytesIO(file_content)) as image:
+        # The re-encoded JPEG carries no EXIF, so bake the camera's orientation
+        # into the pixels or phone photos reach the model sideways
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(
+            (IMAGE_MAX_DIMENSION, IMAGE_MAX_DIMENSION), Image.Resampling.LANCZOS
+        )
+        # JPEG has no alpha channel or palette; flatten transparency onto white
+        # so dark text on a transparent background stays readable
+        if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, "white")
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+        buffer = BytesIO()
+        image.save(buffer, format="JPEG", quality=IMAGE_JPEG_QUALITY)
+
+    compressed = buffer.getvalue()
+    if len(compressed) >= len(file_content):
+        return file_content, file_format
+    return compressed, "jpeg"
+
+
+def read_bytes_from_s3(bucket, key, size):
+    """
+    Downloads a binary object from S3, with parallel ranged GETs if it is above
+    the multipart threshold. The buffer is local, so the returned bytes (which
+    getvalue() shares with it rather than copies) are the only copy left alive.
+    """
+    if size < s3_transfer_config.multipart_threshold:
+        # download_fileobj() always sends a HeadObject first; a small object
+        # only needs the one GetObject
+        return s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+
+    buffer = BytesIO()
+    s3_client.download_fileobj(
+        Bucket=bucket, Key=key, Fileobj=buffer, Config=s3_transfer_config
+    )
+    return buffer.getvalue()
+
+
+def read_text_from_s3(bucket, key):
+    """
+    Reads up to TEXT_READ_LIMIT bytes of a UTF-8 text object from S3.
+    The bytes are sent to Bedrock as-is, so they are never decoded here.
+    """
+    try:
+        response = s3_client.get_object(
+            Bucket=bucket, Key=key, Range=f"bytes=0-{TEXT_READ_LIMIT - 1}"
+        )
+    except ClientError as e:
+        # S3 cannot satisfy a range on an empty object
+        if e.response["Error"]["Code"] == "InvalidRange":
+            return b""
+        raise
+
+    file_content = response["Body"].read()
+
+    # Content-Range looks like "bytes 0-65535/123456"
+    object_size = int(response["ContentRange"].rpartition("/")[2])
+    if object_size > TEXT_READ_LIMIT:
+        logger.info(
+            "Reading the first %s of %s bytes of %s", TEXT_READ_LIMIT, object_size, key
+        )
+        file_content = trim_partial_utf8(file_content)
+    return file_content
+
+
+def trim_partial_utf8(data):
+    """
+    Drops a multi-byte UTF-8 character that was cut off at the end of data.
+    """
+    # Look back past up to 3 continuation bytes (0b10xxxxxx) for the lead byte
+    for offset in range(1, min(4, len(data)) + 1):
+        byte = data[-offset]
+        if byte & 0xC0 != 0x80:
+            if byte >= 0xF0:
+                length = 4
+            elif byte >= 0xE0:
+                length = 3
+            elif byte >= 0xC0:
+                length = 2
+            else:
+                length = 1
+            return data if length <= offset else data[:-offset]
+    return data
+
+
+def to_decimal(value):
+    """
+    Converts a numeric tool value to a Decimal DynamoDB accepts, falling back
+    to 0 for missing, unparseable or out-of-range values.
+    """
+    if value is None:
+        return DECIMAL_ZERO
+    if not isinstance(value, int):
+        # str() keeps floats at their shortest repr instead of the binary expansion
+        # (ints, bool included, convert exactly as they are)
+        value = str(value)
+    try:
+        # DYNAMODB_CONTEXT raises on more than 38 digits or an exponent out of range
+        result = DYNAMODB_CONTEXT.create_decimal(value)
+    except DecimalException:
+        return DECIMAL_ZERO
+    # Unparseable strings become NaN; DynamoDB rejects NaN and Infinity
+    return result if result.is_finite() else DECIMAL_ZERO
+
+
+def call_bedrock_converse(file_content, file_format):
+    """
+    Calls Bedrock Converse API with the file content and returns the extracted PC specs.
+    Supports PNG, JPEG, PDF, and text files, all passed as bytes.
+    """
+    try:
+        # Start with the static instruction blocks so they form a cacheable prefix
+        content_list = list(INSTRUCTION_CONTENT)
+
+        # Add content based on file format
+        if file_format in ["png", "jpeg"]:
+            # For image files
+            content_list.append(
+                {"image": {"format": file_format, "source": {"bytes": file_content}}}
+            )
+        elif file_format in DOCUMENT_FORMATS:
+            # For PDF and text files - pass the raw bytes as a document block;
+            # botocore handles the base64 wire encoding and Bedrock decodes text
+            content_list.append(
+                {
+                    "document": {
+                        "format": DOCUMENT_FORMATS[file_format],
+                        "name": "filename",
+                        "source": {"bytes": file_content},
+                    }
+                }
+            )
+
+        # Create the messages for the Converse API
+        messages = [
+            {
+                "role": "user",
+                "content": content_list,
+            }
+        ]
+
+        # Call the streaming Converse API so the response is consumed as it is generated
+        response = bedrock_runtime.converse_stream(
+            modelId=BEDROCK_MODEL_ID,
+            messages=messages,
+            toolConfig=TOOL_CONFIG,
+        )
+
+        # Accumulate the JSON tool input, which arrives as string fragments per content block
+        tool_input_parts = {}
+        for event in response["stream"]:
+            if "contentBlockStart" in event:
+                block = event["contentBlockStart"]
+                if "toolUse" in block["start"]:
+                    tool_input_parts[block["contentBlockIndex"]] = []
+            elif "contentBlockDelta" in event:
+                block = event["contentBlockDelta"]
+                if "toolUse" in block["delta"]:
+                    tool_input_parts[block["contentBlockIndex"]].append(
+                        block["delta"]["toolUse"]["input"]
+                    )
+
+        # Extract the JSON tool response from the last tool use block
+        tool_response = None
+        if tool_input_parts:
+            tool_input = "".join(tool_input_parts[max(tool_input_parts)])
+            if tool_input:
+                tool_response = json.loads(tool_input)
+
+        if not tool_response:
+            logger.error("Failed to extract PC specs from Bedrock response")
+            raise Exception("Failed to extract PC specs from Bedrock response")
+
+        # Default missing string fields to an empty string
+        for field in STRING_FIELDS:
+            if tool_response.get(field) is None:
+                tool_response[field] = ""
+
+        # Convert numeric fields to Decimal here so DynamoDB's serializer never
+        # has to handle (or reject) Python floats
+        for field in NUMERIC_FIELDS:
+            tool_response[field] = to_decimal(tool_response.get(field))
+
+        return tool_response
+
+    except Exception as e:
+        logger.error("Error calling Bedrock Converse API: %s", e)
+        raise e
+
+
+def to_attribute_value(value):
+    """
+    Converts a Python value to a DynamoDB attribute value. Strings and finite
+    numbers, which make up the PC specs, skip boto3's generic TypeSerializer.
+    """
+    if isinstance(value, str):
+        return {"S": value}
+    if (isinstance(value, int) and not isinstance(value, bool)) or (
+        isinstance(value, Decimal) and value.is_finite()
+    ):
+        # Validated like TypeSerializer does, so an out-of-range number fails
+        # here instead of failing a whole BatchWriteItem call
+        return {"N": str(DYNAMODB_CONTEXT.create_decimal(value))}
+    # TypeSerializer rejects floats, NaN and Infinity
+    return type_serializer.serialize(value)
+
+
+def to_dynamodb_item(pc_specs):
+    """
+    Converts the PC specs dict to a low-level DynamoDB item.
+    """
+    return {key: to_attribute_value(value) for key, value in pc_specs.items()}
+
+
+def backoff_delay(attempt):
+    """
+    Returns a jittered exponential backoff delay in seconds, capped at 1 second.
+    """
+    return jitter.uniform(0, min(2**attempt * 0.05, 1.0))
+
+
+def write_with_backoff(operation, **kwargs):
+    """
+    Calls a DynamoDB write operation, retrying throttling errors with backoff so
+    a transient throttle does not fail the invocation and repeat its Bedrock calls.
+    """
+    for attempt in range(DYNAMODB_WRITE_ATTEMPTS):
+        try:
+            return operation(**kwargs)
+        except ClientError as e:
+            if (
+                e.response["Error"]["Code"] not in RETRYABLE_DYNAMODB_ERRORS
+                or attempt == DYNAMODB_WRITE_ATTEMPTS - 1
+            ):
+                raise
+            time.sleep(backoff_delay(attempt))
+
+
+class BatchWriter:
+    """
+    Buffers items and writes them with BatchWriteItem in chunks of up to 25,
+    re-queueing any unprocessed items. Like boto3's Table.batch_writer with
+    overwrite_by_pkeys=["name"], a later item with the same name replaces a
+    buffered one. Remaining items are flushed on exit.
+    """
+
+    def __init__(self):
+        self._items = {}
+        self._unprocessed_rounds = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        while self._items:
+            self._flush()
+
+    def put_item(self, Item):
+        self._items.pop(Item["name"], None)
+        self._items[Item["name"]] = to_dynamodb_item(Item)
+        if len(self._items) >= BATCH_WRITE_SIZE:
+            self._flush()
+
+    def _flush(self):
+        names = list(self._items)[:BATCH_WRITE_SIZE]
+        requests = [{"PutRequest": {"Item": self._items.pop(name)}} for name in names]
+        response = write_with_backoff(
+            dynamodb_client.batch_write_item,
+            RequestItems={DYNAMODB_TABLE_NAME: requests},
+        )
+        unprocessed = response.get("UnprocessedItems", {}).get(DYNAMODB_TABLE_NAME, [])
+        if not unprocessed:
+            self._unprocessed_rounds = 0
+            return
+
+        # Put unprocessed items back unless a newer item with the same name arrived,
+        # and back off before the next request since the table is throttling
+        for request in unprocessed:
+            item = request["PutRequest"]["Item"]
+            self._items.setdefault(item["name"]["S"], item)
+        time.sleep(backoff_delay(self._unprocessed_rounds))
+        self._unprocessed_rounds += 1
+
+
+def store_in_dynamodb(pc_specs, default_name, batch=None):
+    """
+    Stores the extracted PC specs in DynamoDB, named default_name if Bedrock
+    found no name. Writes with PutItem by default, or queues the item in the
+    given BatchWriter. Items with the default name are always written with a
+    conditional PutItem.
+    """
+    try:
+        # Store the item in DynamoDB
+        if not pc_specs.get("name"):
+            # The conditional put (not possible in a batch) keeps the first item
+            # written for this upload; a failed condition means a retry of the
+            # event already stored it
+            pc_specs["name"] = default_name
+            try:
+                write_with_backoff(
+                    dynamodb_client.put_item,
+                    TableName=DYNAMODB_TABLE_NAME,
+                    Item=to_dynamodb_item(pc_specs),
+                    ConditionExpression="attribute_not_exists(#n)",
+                    ExpressionAttributeNames={"#n": "name"},
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                logger.info("PC specs already stored: %s", pc_specs["name"])
+                return
+        elif batch is None:
+            write_with_backoff(
+                dynamodb_client.put_item,
+                TableName=DYNAMODB_TABLE_NAME,
+                Item=to_dynamodb_item(pc_specs),
+            )
+        else:
+            batch.put_item(Item=pc_specs)
+
+        logger.info("Successfully stored PC specs in DynamoDB: %s", pc_specs["name"])
+
+    except Exception as e:
+        logger.error("Error storing in DynamoDB: %s", e)
+        raise e
@@ -58,7 +58,12 @@ class BedrockJsonStack(Stack):
         )
         lambda_role.add_to_policy(
             iam.PolicyStatement(
-                actions=["dynamodb:PutItem", "dynamodb:UpdateItem"],
+                actions=[
+                    "dynamodb:PutItem",
+                    "dynamodb:UpdateItem",
+                    "dynamodb:BatchWriteItem",
+                    "dynamodb:DescribeTable",
+                ],
                 resources=[pc_specs_table.table_arn],
             )
         )
@@ -66,6 +71,8 @@ class BedrockJsonStack(Stack):
             iam.PolicyStatement(
                 actions=[
                     "bedrock:InvokeModel",
+                    "bedrock:InvokeModelWithResponseStream",
+                    "bedrock:ListAsyncInvokes",
                     "bedrock-runtime:InvokeModel",
                     "bedrock-runtime:Converse",
                 ],
@@ -79,59 +86,60 @@ class BedrockJsonStack(Stack):
         lambda_layer = lambda_.LayerVersion(
             self,
             "PCSpecsLambdaLayer",
-            code=lambda_.Code.from_asset("app"),
-            compatible_runtimes=[lambda_.Runtime.PYTHON_3_11],
+            code=lambda_.Code.from_asset("app/layer"),
+            compatible_runtimes=[lambda_.Runtime.PYTHON_3_12],
+            compatible_architectures=[lambda_.Architecture.ARM_64],
             description="Layer containing dependencies for file processing",
         )
 
+        # Lambda sizing, overridable with -c lambda_memory=<MB> after power tuning.
+        # 1769 MB is one full vCPU; reserved concurrency keeps S3 upload bursts
+        # from cascading into Bedrock throttling
+        lambda_memory = int(self.node.try_get_context("lambda_memory") or 1769)
+        # -c lambda_reserved_concurrency=none (or 0) reserves nothing, for accounts
+        # whose concurrency quota cannot spare 200. Reserving 0 would throttle
+        # every invocation. Context values from the CLI are strings
+        lambda_reserved_concurrency = self.node.try_get_context(
+            "lambda_reserved_concurrency"
+        )
+        if lambda_reserved_concurrency is None:
+            lambda_reserved_concurrency = 200
+        elif str(lambda_reserved_concurrency).lower() in ("none", "0"):
+            lambda_reserved_concurrency = None
+        else:
+            lambda_reserved_concurrency = int(lambda_reserved_concurrency)
+        # Only warnings and errors are logged unless overridden with -c log_level=INFO
+        log_level = self.node.try_get_context("log_level") or "WARNING"
+
         # Create Lambda function with increased timeout and memory for file processing
         pc_specs_lambda = lambda_.Function(
             self,
             "PCSpecsLambdaFunction",
-            runtime=lambda_.Runtime.PYTHON_3_11,
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
             handler="index.handler",
-            code=lambda_.Code.from_asset("app"),
+            code=lambda_.Code.from_asset("app/handler"),
             layers=[lambda_layer],
             role=lambda_role,
             timeout=Duration.seconds(60),  # Increased timeout for file processing
-            memory_size=512,  # Increased memory for handling files
+            memory_size=lambda_memory,
+            reserved_concurrent_executions=lambda_reserved_concurrency,
             environment={
                 "DYNAMODB_TABLE_NAME": pc_specs_table.table_name,
+                "PC_SPECS_BUCKET_NAME": pc_specs_bucket.bucket_name,
+                "LOG_LEVEL": log_level,
                 "BEDROCK_MODEL_ID": "us.anthropic.claude-sonnet-4-20250514-v1:0",  # Correct model ID for Claude 3 Sonnet
             },
+            snap_start=lambda_.SnapStartConf.ON_PUBLISHED_VERSIONS,
         )
 
-        # Add S3 event notifications to trigger Lambda for supported file types
-        # PNG files
-        pc_specs_bucket.add_event_notification(
-            s3.EventType.OBJECT_CREATED,
-            s3n.LambdaDestination(pc_specs_lambda),
-            s3.NotificationKeyFilter(suffix=".png"),
-        )
-        
-        # JPEG files
-        pc_specs_bucket.add_event_notification(
-            s3.EventType.OBJECT_CREATED,
-            s3n.LambdaDestination(pc_specs_lambda),
-            s3.NotificationKeyFilter(suffix=".jpg"),
-        )
-        
-        pc_specs_bucket.add_event_notification(
-            s3.EventType.OBJECT_CREATED,
-            s3n.LambdaDestination(pc_specs_lambda),
-            s3.NotificationKeyFilter(suffix=".jpeg"),
-        )
-        
-        # PDF files
-        pc_specs_bucket.add_event_notification(
-            s3.EventType.OBJECT_CREATED,
-            s3n.LambdaDestination(pc_specs_lambda),
-            s3.NotificationKeyFilter(suffix=".pdf"),
-        )
-        
-        # Text files
+        # SnapStart only applies to published versions, so S3 invokes the
+        # function through an alias pointing at the latest version
+        pc_specs_lambda_alias = pc_specs_lambda.add_alias("live")
+
+        # Add a single S3 event notification for all uploads; the handler filters
+        # out unsupported file types by extension before reading the object
         pc_specs_bucket.add_event_notification(
             s3.EventType.OBJECT_CREATED,
-            s3n.LambdaDestination(pc_specs_lambda),
-            s3.NotificationKeyFilter(suffix=".txt"),
+            s3n.LambdaDestination(pc_specs_lambda_alias),
         )
@@ -1,9 +1,14 @@
 #!/bin/bash
 
 # Create a directory for the layer
-mkdir -p app/python
+mkdir -p app/layer/python
 
-# Install dependencies into the layer directory
-pip install -r app/requirements.txt -t app/python
+# Install dependencies into the layer directory, using wheels built for
+# the Lambda runtime (Python 3.12 on ARM64)
+pip install -r app/layer/requirements.txt -t app/layer/python \
+    --platform manylinux2014_aarch64 \
+    --python-version 3.12 \
+    --implementation cp \
+    --only-binary=:all:
 
 echo "Lambda layer dependencies installed successfully!"